@@ -27,6 +27,13 @@ def build_exe():
     print("Building PPTX_to_Picture.exe")
     print("="*50 + "\n")
     
+    # 3.11's adaptive interpreter is a free speedup for the Python-bound
+    # paths (path handling, list building), so pin the build env to it
+    if sys.version_info < (3, 11):
+        print("[ERROR] Python 3.11+ required to build (found %d.%d)" % sys.version_info[:2])
+        print("Upgrade the build environment and retry.")
+        sys.exit(1)
+
     # Check if PyInstaller is installed
     try:
         import PyInstaller
@@ -36,23 +43,35 @@ def build_exe():
         print("Install with: pip install pyinstaller")
         sys.exit(1)
     
-    # Clean first
-    clean_build()
-    
+    # Keeping build/ lets PyInstaller reuse its analysis cache, which
+    # makes incremental rebuilds much faster. Pass --clean for a fresh build.
+    if '--clean' in sys.argv:
+        clean_build()
+
     # Build with PyInstaller
+    # onedir by default: onefile unpacks the whole ~60-100 MB bundle to a
+    # temp folder on every launch, adding up to seconds of startup time.
+    # Set BUILD_ONEFILE=1 for the old single-exe behavior.
+    onefile = bool(os.environ.get('BUILD_ONEFILE'))
     print("\nBuilding EXE...")
-    cmd = [
-        'pyinstaller',
-        '--onefile',
-        '--windowed',
-        '--name=PPTX_to_Picture',
-        '--hidden-import=tkinterdnd2',
-        '--hidden-import=pdf2image',
-        '--hidden-import=svgwrite',
-        '--hidden-import=PIL._tkinter_finder',
-        '--noconfirm',
-        'pptx_to_picture.py'
-    ]
+    if onefile:
+        cmd = [
+            'pyinstaller',
+            '--onefile',
+            '--windowed',
+            '--name=PPTX_to_Picture',
+            '--hidden-import=tkinterdnd2',
+            '--hidden-import=fitz',
+            '--hidden-import=svgwrite',
+            '--hidden-import=PIL._tkinter_finder',
+            '--optimize=2',
+            '--noconfirm',
+            'pptx_to_picture.py'
+        ]
+    else:
+        # The committed spec carries hiddenimports and excludes, so
+        # PyInstaller skips CLI-driven option analysis and bundles less
+        cmd = ['pyinstaller', '--noconfirm', 'pptx_to_picture.spec']
     
     result = subprocess.run(cmd, capture_output=False)
     
@@ -61,9 +80,21 @@ def build_exe():
         sys.exit(1)
     
     # Check if EXE was created
-    exe_path = os.path.join('dist', 'PPTX_to_Picture.exe')
+    if onefile:
+        exe_path = os.path.join('dist', 'PPTX_to_Picture.exe')
+    else:
+        exe_path = os.path.join('dist', 'PPTX_to_Picture', 'PPTX_to_Picture.exe')
     if os.path.exists(exe_path):
-        size_mb = os.path.getsize(exe_path) / (1024 * 1024)
+        if onefile:
+            size_mb = os.path.getsize(exe_path) / (1024 * 1024)
+        else:
+            # Report the whole onedir bundle size
+            bundle_dir = os.path.dirname(exe_path)
+            size_mb = sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, _, names in os.walk(bundle_dir)
+                for name in names
+            ) / (1024 * 1024)
         print(f"\n" + "="*50)
         print(f"[SUCCESS] EXE created!")
         print(f"[PATH] {exe_path}")
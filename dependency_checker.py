@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+External tool discovery for PPTX to Picture Converter.
+
+The only external tool this app shells out to is LibreOffice (for .odp
+input), but locating it is not free: shutil.which walks and stats every
+PATH entry, and the Program Files probes stat directories that virus
+scanners love to intercept. Resolved paths are therefore cached twice -
+in-process for the session, and on disk so the next launch skips the
+search entirely. Cached entries are revalidated with a single isfile
+check, so a moved or uninstalled tool just triggers a fresh probe.
+"""
+import os
+import json
+import shutil
+
+# One file per user, shared by all launches
+_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".pptx2pic_deps.json")
+
+# Well-known install locations probed after PATH. Built once at import
+# from the environment rather than hard-coding drive letters: relocated
+# Program Files (and repeated os.environ lookups) are resolved here,
+# never per probe.
+_PROGRAM_FILES = os.environ.get("PROGRAMFILES", r"C:\Program Files")
+_PROGRAM_FILES_X86 = os.environ.get("PROGRAMFILES(X86)", r"C:\Program Files (x86)")
+_DEFAULT_LOCATIONS = {
+    "soffice": (os.path.join(_PROGRAM_FILES, "LibreOffice", "program", "soffice.exe"),
+                os.path.join(_PROGRAM_FILES_X86, "LibreOffice", "program", "soffice.exe")),
+}
+
+def _find_soffice_registry():
+    # LibreOffice records its install dir under SOFTWARE\LibreOffice\
+    # UNO\InstallPath - one registry read instead of guessing at
+    # Program Files layouts (covers non-default install drives too)
+    try:
+        import winreg
+    except ImportError:
+        return None  # non-Windows dev box
+    for root in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+        try:
+            with winreg.OpenKey(root, r"SOFTWARE\LibreOffice\UNO\InstallPath") as key:
+                install_dir, _ = winreg.QueryValueEx(key, None)
+            candidate = os.path.join(install_dir, "soffice.exe")
+            if os.path.isfile(candidate):
+                return candidate
+        except OSError:
+            continue
+    return None
+
+
+# Registry-backed lookups tried after PATH, before filesystem guessing
+_REGISTRY_PROBES = {
+    "soffice": _find_soffice_registry,
+}
+
+# name -> resolved path; None until the disk cache is read
+_paths = None
+
+
+def _load_cache():
+    global _paths
+    if _paths is None:
+        try:
+            with open(_CACHE_FILE, "r", encoding="utf-8") as fh:
+                _paths = json.load(fh)
+        except (OSError, ValueError):
+            _paths = {}
+    return _paths
+
+
+def _save_cache():
+    try:
+        with open(_CACHE_FILE, "w", encoding="utf-8") as fh:
+            json.dump(_paths, fh)
+    except OSError:
+        pass  # cache is an optimization; never fail a conversion over it
+
+
+def find_tool(name):
+    """Return the full path to `name`, or None if it isn't installed.
+
+    Lookup order: cached result (revalidated), PATH, then well-known
+    install locations. Misses are retried on every call, so a tool
+    installed mid-session is picked up without restarting.
+    """
+    paths = _load_cache()
+    cached = paths.get(name)
+    if cached and os.path.isfile(cached):
+        return cached
+    path = shutil.which(name)
+    if path is None:
+        probe = _REGISTRY_PROBES.get(name)
+        if probe is not None:
+            path = probe()
+    if path is None:
+        for candidate in _DEFAULT_LOCATIONS.get(name, ()):
+            if os.path.isfile(candidate):
+                path = candidate
+                break
+    if path is not None:
+        paths[name] = path
+        _save_cache()
+    return path
+
+
+def find_soffice():
+    """Locate the LibreOffice binary (cached across launches)."""
+    return find_tool("soffice")
@@ -4,14 +4,26 @@ from tkinter import filedialog, messagebox
 import os
 from PIL import Image, ImageTk
 import tempfile
+import subprocess
 import win32com.client
 import pythoncom
 import threading
+import queue
+import collections
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+from dependency_checker import find_soffice
 
 # Configuration for CustomTkinter
 ctk.set_appearance_mode("Dark")  # Modes: "System" (standard), "Dark", "Light"
 ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+VALID_EXTENSIONS = frozenset({'.pptx', '.ppt', '.ppsx', '.pps', '.pdf', '.odp'})
+# Built once from the same extension set the enqueue filter uses, so the
+# dialog and the validator can't drift apart
+FILE_DIALOG_TYPES = [("Files", " ".join("*" + ext for ext in sorted(VALID_EXTENSIONS)))]
+
 DND_AVAILABLE = False
 try:
     from tkinterdnd2 import TkinterDnD, DND_FILES
@@ -19,7 +31,179 @@ try:
 except ImportError:
     pass
 
-class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object):
+MOZJPEG_AVAILABLE = False
+try:
+    import mozjpeg_lossless_optimization
+    MOZJPEG_AVAILABLE = True
+except ImportError:
+    pass
+
+OXIPNG_AVAILABLE = False
+try:
+    import oxipng
+    OXIPNG_AVAILABLE = True
+except ImportError:
+    pass
+
+
+def _mozjpeg_optimize_file(path):
+    # Lossless Huffman-table rewrite of an already-encoded JPG; typically
+    # 5-20% smaller for one memcpy-ish pass, no quality change
+    with open(path, "rb") as fh:
+        data = fh.read()
+    opt = mozjpeg_lossless_optimization.optimize(data)
+    if len(opt) < len(data):
+        with open(path, "wb") as fh:
+            fh.write(opt)
+
+
+def _effective_cpu_count():
+    # os.cpu_count reports the machine, not what this process may use;
+    # process_cpu_count (3.13+) respects affinity masks and container
+    # quotas, so prefer it where available
+    counter = getattr(os, "process_cpu_count", os.cpu_count)
+    return counter() or 1
+
+# Hidden operation comes from WithWindow=0 at Presentations.Open -
+# PowerPoint automation rejects Application.Visible = False outright.
+# Set PPTX2PIC_VISIBLE_PP=1 on a machine whose install misbehaves with
+# windowless decks; the app window then shows minimized instead.
+_PP_VISIBLE_FALLBACK = bool(os.environ.get("PPTX2PIC_VISIBLE_PP"))
+
+def _configure_powerpoint(pp):
+    if _PP_VISIBLE_FALLBACK:
+        try:
+            pp.Visible = True
+            pp.WindowState = 2 # Minimize
+        except:
+            pass
+    try:
+        pp.DisplayAlerts = 1 # ppAlertsNone
+    except:
+        pass
+
+class PPTSession:
+    """One long-lived PowerPoint COM instance on its own STA thread.
+
+    Launching PowerPoint takes seconds while Slides(i).Export takes
+    milliseconds, so preview, slide count and conversion all funnel their
+    COM work through this single session instead of Dispatch()/Quit() per
+    call. Jobs are submitted via a queue so all COM access stays on the
+    session thread regardless of which GUI/worker thread asks.
+    """
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._closed = False
+        self._pp = None
+        self._pres = None
+        self._pres_path = None
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args):
+        # Run fn(*args) on the session thread, block for the result
+        if self._closed:
+            raise RuntimeError("PowerPoint session is shut down")
+        done = threading.Event()
+        box = []
+        self._jobs.put((fn, args, box, done))
+        done.wait()
+        result = box[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def shutdown(self):
+        # Refuse new work first, then let the loop drain and quit
+        self._closed = True
+        done = threading.Event()
+        self._jobs.put((None, (), [], done))
+        done.wait()
+
+    def _run_loop(self):
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        try:
+            while True:
+                fn, args, box, done = self._jobs.get()
+                if fn is None:
+                    done.set()
+                    break
+                try:
+                    box.append(fn(*args))
+                except Exception as e:
+                    box.append(e)
+                done.set()
+        finally:
+            # Fail any jobs that raced in behind the shutdown sentinel
+            # instead of leaving their submitters blocked forever
+            while True:
+                try:
+                    fn, args, box, done = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                box.append(RuntimeError("PowerPoint session is shut down"))
+                done.set()
+            self._close_presentation()
+            if self._pp is not None:
+                try: self._pp.Quit()
+                except: pass
+                self._pp = None
+            pythoncom.CoUninitialize()
+
+    # --- everything below runs on the session thread only ---
+
+    def _application(self):
+        if self._pp is None:
+            self._pp = win32com.client.Dispatch("PowerPoint.Application")
+            _configure_powerpoint(self._pp)
+        return self._pp
+
+    def _open_cached(self, file_path):
+        # Keep the last opened presentation alive, keyed by normalized path,
+        # so preview + count + convert on the same file open it only once
+        path = os.path.abspath(os.path.normpath(file_path))
+        if self._pres is not None and self._pres_path == path:
+            return self._pres
+        self._close_presentation()
+        self._pres = self._application().Presentations.Open(path, 1, 0, 0)
+        self._pres_path = path
+        return self._pres
+
+    def _close_presentation(self):
+        if self._pres is not None:
+            try: self._pres.Close()
+            except: pass
+            self._pres = None
+            self._pres_path = None
+
+    # --- public API, callable from any thread ---
+
+    def slide_count(self, file_path):
+        return self.submit(lambda: self._open_cached(file_path).Slides.Count)
+
+    def export_slide(self, file_path, index, out_path, fmt, width=None, height=None):
+        if width and height:
+            self.submit(lambda: self._open_cached(file_path).Slides(index).Export(out_path, fmt, width, height))
+        else:
+            self.submit(lambda: self._open_cached(file_path).Slides(index).Export(out_path, fmt))
+
+    def save_as_pdf(self, file_path, pdf_path):
+        # 32 = ppSaveAsPDF: one COM round-trip exports the whole deck
+        self.submit(lambda: self._open_cached(file_path).SaveAs(pdf_path, 32))
+
+
+# Pick the base statically: the conditional-expression form evaluated a
+# ternary inside the bases tuple and dragged a redundant `object` into
+# the MRO on the non-DnD path
+if DND_AVAILABLE:
+    class _AppBase(ctk.CTk, TkinterDnD.DnDWrapper):
+        pass
+else:
+    _AppBase = ctk.CTk
+
+
+class PPTXConverter(_AppBase):
     def __init__(self):
         super().__init__()
         
@@ -37,11 +221,62 @@ class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object)
         self.image_format = tk.StringVar(value="PNG")
         self.quality = tk.IntVar(value=95)
         self.number_slides = tk.BooleanVar(value=True)
+        self.mozjpeg = tk.BooleanVar(value=False)
+        self.opt_png = tk.BooleanVar(value=False)
         self.current_preview_file = None
         self.preview_photo = None
+        self._slide_count_cache = {} # (abspath, mtime) -> count
+        self._odp_pdf_cache = {} # (normcase path, mtime) -> converted PDF path
+        self._made_dirs = set() # dirs already created this session
+        # One soffice profile per convert_pool worker: LibreOffice locks
+        # its UserInstallation, so concurrent launches sharing a profile
+        # deadlock or bail. Checked out per invocation below.
+        self._soffice_profiles = queue.Queue()
+        for n in range(2):
+            self._soffice_profiles.put(f"profile-{n}")
+        self._last_slide_count = None
+        self._preview_cache = collections.OrderedDict() # (path, mtime) -> CTkImage
+        self._log_q = collections.deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+        self._inflight = set() # normcased paths queued or converting
+
+        self.ppt = PPTSession()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Bounded conversion pipeline: dropping 50 files used to spawn 50
+        # threads (and 50 PowerPoint clients) at once. The UI just submits
+        # paths; the executor's two long-lived workers do the work.
+        self.convert_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="convert",
+            initializer=pythoncom.CoInitializeEx,
+            initargs=(pythoncom.COINIT_APARTMENTTHREADED,))
+
+        # Pool for the CPU-bound, GIL-releasing work around exports:
+        # page encodes and the optional oxipng/mozjpeg passes
+        self._export_workers = min(4, _effective_cpu_count())
+        self._export_pool = ThreadPoolExecutor(max_workers=self._export_workers,
+                                               thread_name_prefix="pptx-export")
 
         self.setup_ui()
 
+    def _convert_job(self, path):
+        try:
+            self.convert(path)
+        finally:
+            # Not urgent - let pending redraws run first
+            self.after_idle(self._inflight.discard, os.path.normcase(path))
+
+    def on_close(self):
+        # Drop queued conversions so nothing new reaches the COM session
+        # after it quits; an in-flight deck fails fast instead, since
+        # post-shutdown session submits raise rather than re-launching
+        # (and thereby leaking) a PowerPoint instance
+        self.convert_pool.shutdown(wait=False, cancel_futures=True)
+        self._export_pool.shutdown(wait=False, cancel_futures=True)
+        self.ppt.shutdown()
+        self.destroy()
+
     def setup_ui(self):
         self.create_sidebar()
         self.create_main_area()
@@ -49,9 +284,14 @@ class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object)
     def create_sidebar(self):
         self.sidebar_frame = ctk.CTkFrame(self, width=250, corner_radius=0)
         self.sidebar_frame.grid(row=0, column=0, sticky="nsew")
-        self.sidebar_frame.grid_rowconfigure(8, weight=1)
+        self.sidebar_frame.grid_rowconfigure(10, weight=1)
 
-        logo_label = ctk.CTkLabel(self.sidebar_frame, text="PPTX > Picture", font=ctk.CTkFont(size=20, weight="bold"))
+        # Shared font objects: each CTkFont allocates a Tcl font and
+        # metrics round-trips, so build each style once and reuse it
+        self.font_heading = ctk.CTkFont(size=20, weight="bold")
+        self.font_small = ctk.CTkFont(size=12)
+
+        logo_label = ctk.CTkLabel(self.sidebar_frame, text="PPTX > Picture", font=self.font_heading)
         logo_label.grid(row=0, column=0, padx=20, pady=(20, 10))
 
         # Output Format
@@ -74,23 +314,33 @@ class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object)
         self.chk_numbering = ctk.CTkSwitch(self.sidebar_frame, text="Number Slides", variable=self.number_slides, command=self.update_settings_preview)
         self.chk_numbering.grid(row=5, column=0, padx=20, pady=10, sticky="w")
 
+        if MOZJPEG_AVAILABLE:
+            self.chk_mozjpeg = ctk.CTkSwitch(self.sidebar_frame, text="Optimize JPG (mozjpeg)", variable=self.mozjpeg)
+            self.chk_mozjpeg.grid(row=6, column=0, padx=20, pady=(0, 10), sticky="w")
+
+        if OXIPNG_AVAILABLE:
+            self.chk_opt_png = ctk.CTkSwitch(self.sidebar_frame, text="Optimize PNG (slow)", variable=self.opt_png)
+            self.chk_opt_png.grid(row=7, column=0, padx=20, pady=(0, 10), sticky="w")
+
         # Output Directory
         lbl_dir = ctk.CTkLabel(self.sidebar_frame, text="Output Directory:", anchor="w")
-        lbl_dir.grid(row=6, column=0, padx=20, pady=(10, 0), sticky="w")
+        lbl_dir.grid(row=8, column=0, padx=20, pady=(10, 0), sticky="w")
         
-        self.entry_dir = ctk.CTkEntry(self.sidebar_frame, placeholder_text=self.output_dir)
-        self.entry_dir.insert(0, self.output_dir)
+        # StringVar-backed: updating the variable refreshes the readonly
+        # entry without the state-normal/delete/insert/state-readonly dance
+        self.output_dir_var = tk.StringVar(value=self.output_dir)
+        self.entry_dir = ctk.CTkEntry(self.sidebar_frame, textvariable=self.output_dir_var)
         self.entry_dir.configure(state="readonly") # Make read-only so they have to use browse
-        self.entry_dir.grid(row=7, column=0, padx=20, pady=(5, 5), sticky="ew")
+        self.entry_dir.grid(row=9, column=0, padx=20, pady=(5, 5), sticky="ew")
         
         btn_browse = ctk.CTkButton(self.sidebar_frame, text="Browse Folder", command=self.browse_dir)
-        btn_browse.grid(row=8, column=0, padx=20, pady=5, sticky="n")
+        btn_browse.grid(row=10, column=0, padx=20, pady=5, sticky="n")
 
         # Convert / Convert Button (maybe big at bottom?)
         # Let's put a help text at bottom of sidebar
         lbl_help = ctk.CTkLabel(self.sidebar_frame, text="Supported:\nPPTX, PPT, PDF, ODP", 
-                                font=ctk.CTkFont(size=12), text_color="gray")
-        lbl_help.grid(row=9, column=0, padx=20, pady=20, sticky="s")
+                                font=self.font_small, text_color="gray")
+        lbl_help.grid(row=11, column=0, padx=20, pady=20, sticky="s")
 
 
     def create_main_area(self):
@@ -106,7 +356,7 @@ class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object)
         self.drop_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 10))
         
         self.drop_label = ctk.CTkLabel(self.drop_frame, text="DRAG & DROP FILES HERE\n\nor click to select", 
-                                       font=ctk.CTkFont(size=20, weight="bold"))
+                                       font=self.font_heading)
         self.drop_label.place(relx=0.5, rely=0.5, anchor="center")
 
         # Make the whole frame clickable for file selection
@@ -152,8 +402,26 @@ class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object)
         self.update_settings_preview()
 
     def log_msg(self, msg):
+        # Safe to call from worker threads: deque.append is atomic, and
+        # the Tk-side drain coalesces a burst of per-slide messages into
+        # one configure/insert/see round-trip instead of three per line
+        self._log_q.append(msg)
+        with self._log_lock:
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        self.after(50, self._drain_log)
+
+    def _drain_log(self):
+        with self._log_lock:
+            self._log_flush_scheduled = False
+        if not self._log_q:
+            return
+        lines = []
+        while self._log_q:
+            lines.append(self._log_q.popleft())
         self.log_box.configure(state="normal")
-        self.log_box.insert("end", msg + '\n')
+        self.log_box.insert("end", "\n".join(lines) + "\n")
         self.log_box.see("end")
         self.log_box.configure(state="disabled")
 
@@ -163,114 +431,150 @@ class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object)
         self.file_list_box.delete("0.0", "end")
         self.file_list_box.configure(state="disabled")
         self.current_preview_file = None
+        self._last_slide_count = None
 
     def update_preview(self, file_path):
-        try:
-            file_ext = os.path.splitext(file_path)[1].lower()
+        # Only the cached-thumbnail fast path touches widgets here; the
+        # heavy work (PowerPoint export, slide counting) runs off the Tk
+        # thread so the GUI stays responsive the moment a file is dropped
+        file_ext = os.path.splitext(file_path)[1].lower()
 
-            if file_ext == '.odp':
-                self.lbl_preview_img.configure(image=None, text=f"ODP File:\n{os.path.basename(file_path)}\n(No Preview)")
-                slide_count = self.get_slide_count(file_path)
-                self.generate_output_list(file_path, slide_count)
-                self.current_preview_file = file_path
-                return
+        if file_ext == '.odp':
+            self.lbl_preview_img.configure(image=None, text=f"ODP File:\n{os.path.basename(file_path)}\n(No Preview)")
+        else:
+            key = self._preview_key(file_path)
+            cached = self._preview_cache.get(key)
+            if cached is not None:
+                # Revisited file: show the cached thumbnail instantly
+                # instead of launching PowerPoint/pdftoppm again
+                self._preview_cache.move_to_end(key)
+                self.lbl_preview_img.configure(image=cached, text="")
+                self.preview_photo = cached
+            else:
+                threading.Thread(target=self._preview_worker,
+                                 args=(file_path, key), daemon=True).start()
+
+        threading.Thread(target=self._update_preview_compute,
+                         args=(file_path,), daemon=True).start()
 
-            self.extract_preview_image(file_path)
+    def _update_preview_compute(self, file_path):
+        # Worker thread: the slide count may launch PowerPoint or pdfinfo
+        try:
             slide_count = self.get_slide_count(file_path)
-            self.generate_output_list(file_path, slide_count)
-            self.current_preview_file = file_path
+        except Exception:
+            slide_count = 1
+        self.after_idle(self._update_preview_apply, file_path, slide_count)
 
-        except Exception as e:
-            self.lbl_preview_img.configure(image=None, text=f"Preview error:\n{str(e)}")
-            self.file_list_box.configure(state="normal")
-            self.file_list_box.delete("0.0", "end")
-            self.file_list_box.configure(state="disabled")
+    def _update_preview_apply(self, file_path, slide_count):
+        self.generate_output_list(file_path, slide_count)
+        self.current_preview_file = file_path
+        self._last_slide_count = slide_count
+
+    def _preview_key(self, file_path):
+        try:
+            return (file_path, os.path.getmtime(file_path))
+        except OSError:
+            return (file_path, None)
+
+    def _preview_worker(self, file_path, key):
+        ctk_img = self.extract_preview_image(file_path)
+        if ctk_img is not None:
+            self.after_idle(self._apply_preview, key, ctk_img)
+
+    def _apply_preview(self, key, ctk_img):
+        self._preview_cache[key] = ctk_img
+        self._preview_cache.move_to_end(key)
+        while len(self._preview_cache) > 16:
+            self._preview_cache.popitem(last=False)
+        self.lbl_preview_img.configure(image=ctk_img, text="")
+        self.preview_photo = ctk_img # Keep ref
+
+    def _set_preview_text(self, text):
+        # Bound method + args instead of a closure: after() passes the
+        # text through without allocating a new lambda per status update
+        self.after_idle(self._apply_preview_text, text)
+
+    def _apply_preview_text(self, text):
+        self.lbl_preview_img.configure(image=None, text=text)
 
     def extract_preview_image(self, file_path):
-        temp_dir = tempfile.gettempdir()
-        temp_img = os.path.join(temp_dir, "preview.jpg")
+        # Runs on a worker thread: returns the thumbnail CTkImage (or
+        # None) and posts status text back to the UI thread
         file_ext = os.path.splitext(file_path)[1].lower()
 
         try:
             if file_ext in ('.pptx', '.ppt', '.ppsx', '.pps'):
-                pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
-                pp = win32com.client.Dispatch("PowerPoint.Application")
-                # Keep hidden is safer, but sometimes causes issues. Try hidden first.
-                try:
-                    pp.Visible = True # Sometimes needed for export to work reliably
-                    pp.WindowState = 2 # Minimize
-                except:
-                    pass
-
+                # Export small - the preview tile is only ~300px wide.
+                # COM needs a real path; make it unique per call, since
+                # concurrent preview workers sharing one temp file could
+                # overwrite each other between export and (lazy) load
+                fd, temp_img = tempfile.mkstemp(suffix=".jpg")
+                os.close(fd)
                 try:
-                    pptx_path = os.path.abspath(os.path.normpath(file_path))
-                    pres = pp.Presentations.Open(pptx_path, 1, 0, 0)
-                    pres.Slides(1).Export(temp_img, "JPG")
-                    pres.Close()
+                    self.ppt.export_slide(file_path, 1, temp_img, "JPG", 640, 480)
+                    img = Image.open(temp_img)
+                    # draft() lets libjpeg decode at a fraction of full
+                    # size (DCT scaling) - far cheaper than the full
+                    # frame for a tile
+                    img.draft("RGB", (600, 450))
+                    # Materialize the pixels now so the temp file can go
+                    img.load()
                 finally:
-                    try:
-                        pp.Quit()
-                    except:
-                        pass
-                    pythoncom.CoUninitialize()
+                    try: os.remove(temp_img)
+                    except OSError: pass
 
             elif file_ext == '.pdf':
-                from pdf2image import convert_from_path
-                images = convert_from_path(file_path, first_page=1, last_page=1, size=(400, None))
-                if images:
-                    images[0].save(temp_img, "JPEG")
-                else:
-                    raise Exception("No pages found in PDF")
+                import fitz
+                with fitz.open(file_path) as doc:
+                    if doc.page_count == 0:
+                        raise Exception("No pages found in PDF")
+                    page = doc[0]
+                    # Render only as large as the tile needs - rasterizing
+                    # in-process avoids the pdftoppm fork entirely
+                    zoom = 400 / max(page.rect.width, 1)
+                    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+                    img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
             else:
-                self.lbl_preview_img.configure(image=None, text="Format not supported for preview")
-                return
+                self._set_preview_text("Format not supported for preview")
+                return None
 
-            if os.path.exists(temp_img):
-                img = Image.open(temp_img)
-                # Resize keeping aspect ratio to fit in preview box (approx 300x200)
-                # We can use CTkImage for high DPI support
-                ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=(300, 225))
-                
-                self.lbl_preview_img.configure(image=ctk_img, text="")
-                self.preview_photo = ctk_img # Keep ref
-                
-                # Cleanup temp later, or let system handle it
-                # os.remove(temp_img) 
-            else:
-                 self.lbl_preview_img.configure(image=None, text="Preview generation failed")
+            img.thumbnail((300, 225), Image.LANCZOS)
+            # We can use CTkImage for high DPI support
+            return ctk.CTkImage(light_image=img, dark_image=img, size=img.size)
 
         except Exception as e:
-            self.lbl_preview_img.configure(image=None, text=f"Preview error:\n{str(e)}")
+            self._set_preview_text(f"Preview error:\n{str(e)}")
+            return None
 
     def get_slide_count(self, file_path):
+        # Cached by (path, mtime): preview, every settings toggle and
+        # convert all need the count, and recomputing it means launching
+        # PowerPoint (seconds) or pdfinfo again
+        try:
+            key = (file_path, os.path.getmtime(file_path))
+        except OSError:
+            key = None
+        if key is not None and key in self._slide_count_cache:
+            return self._slide_count_cache[key]
+        count = self._compute_slide_count(file_path)
+        if key is not None:
+            self._slide_count_cache[key] = count
+        return count
+
+    def _compute_slide_count(self, file_path):
         file_ext = os.path.splitext(file_path)[1].lower()
 
         if file_ext in ('.pptx', '.ppt', '.ppsx', '.pps'):
-            # Reuse logic (simplified for minimal com activity)
-            pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
-            pp = win32com.client.Dispatch("PowerPoint.Application")
-            try: 
-                pp.Visible = True
-                pp.WindowState = 2
-            except: pass
-            
             try:
-                pres = pp.Presentations.Open(os.path.abspath(file_path), 1, 0, 0)
-                count = pres.Slides.Count
-                pres.Close()
-                return count
+                return self.ppt.slide_count(file_path)
             except:
                 return 1
-            finally:
-                try: pp.Quit()
-                except: pass
-                pythoncom.CoUninitialize()
 
         elif file_ext == '.pdf':
             try:
-                from pdf2image import pdfinfo_from_path
-                info = pdfinfo_from_path(file_path)
-                return info["Pages"]
+                import fitz
+                with fitz.open(file_path) as doc:
+                    return doc.page_count
             except:
                 return 1
         return 1
@@ -281,112 +585,336 @@ class PPTXConverter(ctk.CTk, TkinterDnD.DnDWrapper if DND_AVAILABLE else object)
 
         base = os.path.splitext(os.path.basename(file_path))[0]
         ext = self.image_format.get().lower()
-
-        text = ""
-        for i in range(1, slide_count + 1):
-            num = f"_slide_{i}" if self.number_slides.get() else ""
-            filename = f"{base}{num}.{ext}"
-            text += filename + "\n"
-        
-        self.file_list_box.insert("0.0", text)
+        numbered = self.number_slides.get()
+
+        # join instead of += : quadratic concat hurts on 100+ page PDFs.
+        # Cap the rendered list: the textbox exists to show the naming
+        # scheme, and inserting thousands of Tk text lines for a huge
+        # deck stalls the UI for no information gain
+        shown = min(slide_count, 200)
+        lines = [f"{base}{'_slide_' + str(i) if numbered else ''}.{ext}"
+                 for i in range(1, shown + 1)]
+        if slide_count > shown:
+            lines.append(f"... and {slide_count - shown} more")
+        self.file_list_box.insert("0.0", "\n".join(lines) + "\n")
         self.file_list_box.configure(state="disabled")
 
     def update_settings_preview(self):
         if hasattr(self, 'current_preview_file') and self.current_preview_file:
-            self.generate_output_list(self.current_preview_file, self.get_slide_count(self.current_preview_file))
+            # Use the count captured by update_preview so toggling a
+            # setting never has to recompute it
+            count = self._last_slide_count
+            if count is None:
+                count = self.get_slide_count(self.current_preview_file)
+            self.generate_output_list(self.current_preview_file, count)
 
     def browse_dir(self):
         dir = filedialog.askdirectory(initialdir=self.output_dir)
         if dir:
             self.output_dir = dir
-            self.entry_dir.configure(state="normal")
-            self.entry_dir.delete(0, "end")
-            self.entry_dir.insert(0, dir)
-            self.entry_dir.configure(state="readonly")
+            self.output_dir_var.set(dir)
             self.update_settings_preview()
 
     def on_drop(self, event):
         if DND_AVAILABLE:
-            files = self.Tk.splitlist(self, event.data)
-            for f in files:
-                if os.path.isfile(f):
-                    self.update_preview(f)
-                    threading.Thread(target=self.convert, args=(f,), daemon=True).start()
+            # No isfile pre-pass: _enqueue_files stats each entry once,
+            # after the (free) extension check has already rejected most
+            # junk drops
+            self._enqueue_files(self.Tk.splitlist(self, event.data))
 
     def select_files(self):
-        files = filedialog.askopenfilenames(filetypes=[("Files", "*.pptx *.ppt *.ppsx *.pps *.pdf *.odp")])
+        files = filedialog.askopenfilenames(filetypes=FILE_DIALOG_TYPES)
+        self._enqueue_files(files)
+
+    def _enqueue_files(self, files):
+        # Validate and dedupe at the boundary so unsupported files or a
+        # twice-dropped deck never reach PowerPoint at all
+        # (canonicalized once here; workers and COM reuse it as-is)
+        accepted = []
         for f in files:
+            f = os.path.normpath(os.path.abspath(f))
+            # Cheapest checks first: string tests before the one stat
+            if os.path.splitext(f)[1].lower() not in VALID_EXTENSIONS:
+                self.log_msg(f"SKIP (unsupported): {os.path.basename(f)}")
+                continue
+            key = os.path.normcase(f)
+            if key in self._inflight:
+                self.log_msg(f"SKIP (duplicate): {os.path.basename(f)}")
+                continue
+            if not os.path.isfile(f):
+                self.log_msg(f"SKIP (not a file): {os.path.basename(f)}")
+                continue
+            self._inflight.add(key)
             self.update_preview(f)
-            threading.Thread(target=self.convert, args=(f,), daemon=True).start()
+            accepted.append(f)
+        # ODP files from one drop share a single soffice launch: the
+        # 1-3s cold start is paid once per batch, not once per file
+        odp = [f for f in accepted if f.lower().endswith('.odp')]
+        for f in accepted:
+            if f not in odp:
+                self.convert_pool.submit(self._convert_job, f)
+        if odp:
+            self.convert_pool.submit(self._convert_odp_batch, odp)
+
+    def _convert_odp_batch(self, paths):
+        try:
+            self._warm_odp_batch(paths)
+        except Exception as e:
+            self.log_msg(f"ERROR: {str(e)}")
+        for p in paths:
+            self._convert_job(p)
+
+    def _soffice_convert_to_pdf(self, abs_paths):
+        # soffice accepts many inputs per --convert-to invocation, so a
+        # whole batch rides one process launch. A pinned profile dir
+        # lets repeat launches skip first-run profile setup.
+        # (A long-lived UNO listener would amortize the launch entirely,
+        # but driving one needs python-uno shipped with LibreOffice; a
+        # warm profile + cache keeps the dependency surface at zero.)
+        soffice = find_soffice()
+        if soffice is None:
+            raise RuntimeError("LibreOffice not found - install it for .odp support")
+        out_dir = os.path.join(tempfile.gettempdir(), "pptx2pic_odp")
+        # Check out an isolated warm profile so overlapping batch jobs
+        # can each run their own soffice instead of serializing (or
+        # failing) on a shared profile lock
+        profile_name = self._soffice_profiles.get()
+        try:
+            profile = os.path.join(out_dir, profile_name)
+            self._ensure_dir(profile)
+            subprocess.run(
+                [soffice, "--headless", "--norestore",
+                 "-env:UserInstallation=file:///" + profile.replace("\\", "/"),
+                 "--convert-to", "pdf", "--outdir", out_dir] + list(abs_paths),
+                check=True, stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                # No console flash from a windowed app, and with all std
+                # handles redirected there is nothing to inherit-protect,
+                # so skip the per-handle close pass on spawn
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                close_fds=False)
+        finally:
+            self._soffice_profiles.put(profile_name)
+        results = []
+        for abs_path in abs_paths:
+            pdf_path = os.path.join(
+                out_dir, os.path.splitext(os.path.basename(abs_path))[0] + ".pdf")
+            if not os.path.isfile(pdf_path):
+                raise RuntimeError(f"LibreOffice did not produce {os.path.basename(pdf_path)}")
+            self._odp_pdf_cache[(os.path.normcase(abs_path), os.path.getmtime(abs_path))] = pdf_path
+            results.append(pdf_path)
+        return results
+
+    def _odp_to_pdf(self, abs_path):
+        # Converted PDFs are cached by (path, mtime), so re-dropping the
+        # same deck never pays the soffice launch twice
+        key = (os.path.normcase(abs_path), os.path.getmtime(abs_path))
+        cached = self._odp_pdf_cache.get(key)
+        if cached and os.path.isfile(cached):
+            return cached
+        return self._soffice_convert_to_pdf([abs_path])[0]
+
+    def _warm_odp_batch(self, abs_paths):
+        missing = []
+        for p in abs_paths:
+            key = (os.path.normcase(p), os.path.getmtime(p))
+            cached = self._odp_pdf_cache.get(key)
+            if not (cached and os.path.isfile(cached)):
+                missing.append(p)
+        if missing:
+            self._soffice_convert_to_pdf(missing)
+
+    def _ensure_dir(self, path):
+        # os.makedirs stats every path component even when the target
+        # exists; skip the syscalls for dirs we already created
+        if path not in self._made_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._made_dirs.add(path)
+
+    def _temp_dir_for_output(self):
+        # Keep intermediates on the same volume as the output dir, so the
+        # final save isn't a cross-drive (or cross-network-share) copy
+        sys_tmp = tempfile.gettempdir()
+        if os.path.splitdrive(sys_tmp)[0].lower() == os.path.splitdrive(self.output_dir)[0].lower():
+            return sys_tmp
+        tmp = os.path.join(self.output_dir, ".pptxtmp")
+        self._ensure_dir(tmp)
+        return tmp
 
     def convert(self, file_path):
         try:
             self.log_msg(f"START: {os.path.basename(file_path)}")
-            
-            abs_path = os.path.abspath(file_path)
-            
-            # PowerPoint / Conversion Logic (Similar to before)
-            file_ext = os.path.splitext(abs_path)[1].lower()
-            
-            if file_ext in ('.pptx', '.ppt', '.ppsx', '.pps'):
-                pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
-                pp = win32com.client.Dispatch("PowerPoint.Application")
-                try: 
-                    pp.Visible = True
-                    pp.WindowState = 2 # Minimize
-                except: pass
 
-                pres = None
-                try:
-                    pres = pp.Presentations.Open(abs_path, 1, 0, 0)
-                    base = os.path.splitext(os.path.basename(file_path))[0]
-                    temp_dir = tempfile.gettempdir()
+            # Paths arrive canonicalized from the UI boundary
+            abs_path = file_path
+            file_ext = os.path.splitext(abs_path)[1].lower()
+            base = os.path.splitext(os.path.basename(abs_path))[0]
+            # Extension dispatch is a table, not an if/elif chain: adding
+            # an input format means one handler plus one entry below
+            handler = self._CONVERTERS[file_ext]
+            handler(self, abs_path, base)
 
-                    for i in range(1, pres.Slides.Count + 1):
-                        temp_img = os.path.join(temp_dir, f"temp_{i}.jpg")
-                        pres.Slides(i).Export(temp_img, "JPG")
+            self.log_msg(f"DONE: {os.path.basename(file_path)}")
 
-                        img = Image.open(temp_img)
-                        num = f"_slide_{i}" if self.number_slides.get() else ""
-                        final = os.path.join(self.output_dir, f"{base}{num}.{self.image_format.get().lower()}")
+        except Exception as e:
+            import traceback
+            self.log_msg(f"ERROR: {str(e)}")
+            print(traceback.format_exc())
 
-                        fmt = self.image_format.get()
-                        if fmt == "JPG":
-                            img.save(final, "JPEG", quality=self.quality.get())
+    def _convert_ppt_slides(self, abs_path, base):
+        temp_dir = self._temp_dir_for_output()
+
+        slide_count = self.get_slide_count(abs_path)
+        # Snapshot the Tk variables once: StringVar.get() walks the
+        # Tcl interpreter, and touching it N times per deck from a
+        # worker thread is neither fast nor safe
+        fmt = self.image_format.get()
+        fmt_lower = fmt.lower()
+        quality = self.quality.get()
+        numbered = self.number_slides.get()
+        use_mozjpeg = MOZJPEG_AVAILABLE and fmt == "JPG" and self.mozjpeg.get()
+        use_oxipng = OXIPNG_AVAILABLE and fmt == "PNG" and self.opt_png.get()
+        # PowerPoint exports PNG/BMP/JPG natively - skip the JPG
+        # intermediate and the PIL re-encode (which also lost
+        # quality for PNG/BMP by going through JPEG). Only sub-95
+        # JPG quality needs the PIL roundtrip, since PowerPoint's
+        # JPG quality isn't controllable.
+        direct = fmt in ("PNG", "BMP") or (fmt == "JPG" and quality >= 95)
+
+        if direct:
+            # All COM work funnels through the single PPTSession:
+            # PowerPoint.Application is a single-instance COM server, so
+            # extra Dispatch calls only alias the same process and can't
+            # export in parallel. The optimizer passes are real native
+            # CPU work though, so those still fan out over the pool.
+            opt_futures = []
+            for i in range(1, slide_count + 1):
+                num = f"_slide_{i}" if numbered else ""
+                final = os.path.join(self.output_dir, f"{base}{num}.{fmt_lower}")
+                self.ppt.export_slide(abs_path, i, final, fmt)
+                if use_mozjpeg:
+                    opt_futures.append(self._export_pool.submit(_mozjpeg_optimize_file, final))
+                elif use_oxipng:
+                    opt_futures.append(self._export_pool.submit(oxipng.optimize, final, level=4))
+                self.log_msg(f"  > Saved: {base}{num}.{fmt_lower}")
+            for future in opt_futures:
+                future.result()
+        else:
+            # Quality-controlled JPG: instead of N per-slide COM
+            # Export calls + N temp JPGs, save the deck to PDF in
+            # one COM round-trip and rasterize in-process
+            import fitz
+            pdf_path = os.path.join(temp_dir, base + ".pdf")
+            self.ppt.save_as_pdf(abs_path, pdf_path)
+            try:
+                doc = fitz.open(pdf_path)
+                try:
+                    for i, page in enumerate(doc, start=1):
+                        pix = page.get_pixmap(dpi=150)
+                        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                        num = f"_slide_{i}" if numbered else ""
+                        final = os.path.join(self.output_dir, f"{base}{num}.{fmt_lower}")
+                        # Pin encoder options: optimize/progressive
+                        # cost 20-40% extra CPU per slide for little
+                        # gain, and 4:2:0 subsampling is fine below
+                        # quality 90
+                        if use_mozjpeg:
+                            buf = BytesIO()
+                            img.save(buf, "JPEG", quality=quality,
+                                     optimize=False, progressive=False,
+                                     subsampling=2 if quality < 90 else 0)
+                            with open(final, "wb") as fh:
+                                fh.write(mozjpeg_lossless_optimization.optimize(buf.getvalue()))
                         else:
-                            img.save(final, fmt)
-
-                        os.remove(temp_img)
+                            img.save(final, "JPEG", quality=quality,
+                                     optimize=False, progressive=False,
+                                     subsampling=2 if quality < 90 else 0)
                         self.log_msg(f"  > Saved: {os.path.basename(final)}")
-
-                    pres.Close()
                 finally:
-                    try: pp.Quit()
-                    except: pass
-                    pythoncom.CoUninitialize()
-            
-            elif file_ext == '.pdf':
-                from pdf2image import convert_from_path
-                base = os.path.splitext(os.path.basename(file_path))[0]
-                images = convert_from_path(abs_path)
-                
-                for i, img in enumerate(images):
-                    num = f"_slide_{i+1}" if self.number_slides.get() else ""
-                    final = os.path.join(self.output_dir, f"{base}{num}.{self.image_format.get().lower()}")
-                    
-                    fmt = self.image_format.get()
-                    if fmt == "JPG":
-                        img.save(final, "JPEG", quality=self.quality.get())
+                    doc.close()
+            finally:
+                try: os.remove(pdf_path)
+                except OSError: pass
+
+        if os.path.basename(temp_dir) == ".pptxtmp":
+            self._made_dirs.discard(temp_dir)
+            try: os.rmdir(temp_dir)
+            except OSError: pass
+
+    def _convert_odp(self, abs_path, base):
+        self._convert_pdf_pages(self._odp_to_pdf(abs_path), base)
+
+    def _convert_pdf_pages(self, abs_path, base):
+        # Rasterize in-process with PyMuPDF: no pdftoppm fork, and no
+        # whole-deck list of PIL images in RAM like pdf2image built.
+        # Document access is not thread-safe, so pages render one at a
+        # time on this thread - but a finished Pixmap is independent of
+        # its document, so the CPU-heavy encode (plus any optimizer
+        # pass) fans out over the export pool and overlaps the next
+        # page's render. Outstanding jobs are capped so a huge PDF
+        # still holds only a bounded number of pixmaps at once.
+        import fitz
+        fmt = self.image_format.get()
+        fmt_lower = fmt.lower()
+        quality = self.quality.get()
+        numbered = self.number_slides.get()
+        use_mozjpeg = MOZJPEG_AVAILABLE and fmt == "JPG" and self.mozjpeg.get()
+        use_oxipng = OXIPNG_AVAILABLE and fmt == "PNG" and self.opt_png.get()
+
+        def _encode_page(pix, final):
+            if fmt == "PNG":
+                # Pixmap.save writes PNG natively - no PIL round-trip
+                pix.save(final)
+                if use_oxipng:
+                    oxipng.optimize(final, level=4)
+            else:
+                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+                if fmt == "JPG":
+                    # Pin encoder options: optimize/progressive cost
+                    # 20-40% extra CPU per slide for little gain, and
+                    # 4:2:0 subsampling is fine below quality 90
+                    if use_mozjpeg:
+                        buf = BytesIO()
+                        img.save(buf, "JPEG", quality=quality,
+                                 optimize=False, progressive=False,
+                                 subsampling=2 if quality < 90 else 0)
+                        with open(final, "wb") as fh:
+                            fh.write(mozjpeg_lossless_optimization.optimize(buf.getvalue()))
                     else:
-                        img.save(final, fmt)
-                    self.log_msg(f"  > Saved: {os.path.basename(final)}")
-
-            self.log_msg(f"DONE: {os.path.basename(file_path)}")
+                        img.save(final, "JPEG", quality=quality,
+                                 optimize=False, progressive=False,
+                                 subsampling=2 if quality < 90 else 0)
+                else:
+                    img.save(final, fmt)
+            self.log_msg(f"  > Saved: {os.path.basename(final)}")
 
-        except Exception as e:
-            import traceback
-            self.log_msg(f"ERROR: {str(e)}")
-            print(traceback.format_exc())
+        doc = fitz.open(abs_path)
+        futures = collections.deque()
+        try:
+            for i, page in enumerate(doc, start=1):
+                pix = page.get_pixmap(dpi=150)
+                num = f"_slide_{i}" if numbered else ""
+                final = os.path.join(self.output_dir, f"{base}{num}.{fmt_lower}")
+                while len(futures) >= self._export_workers * 2:
+                    futures.popleft().result()
+                futures.append(self._export_pool.submit(_encode_page, pix, final))
+                pix = None
+            for future in futures:
+                future.result()
+        finally:
+            doc.close()
+
+
+    # Built at class definition; values are plain functions, called as
+    # handler(self, abs_path, base)
+    _CONVERTERS = {
+        '.pptx': _convert_ppt_slides,
+        '.ppt': _convert_ppt_slides,
+        '.ppsx': _convert_ppt_slides,
+        '.pps': _convert_ppt_slides,
+        '.pdf': _convert_pdf_pages,
+        '.odp': _convert_odp,
+    }
 
 if __name__ == "__main__":
     app = PPTXConverter()
@@ -1,34 +1,46 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+# Committed spec so PyInstaller skips CLI-driven import rediscovery on
+# every build. The excludes are big packages PyInstaller tends to pick
+# up from the environment even though this app never imports them.
 
 a = Analysis(
     ['pptx_to_picture.py'],
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['tkinterdnd2', 'pdf2image', 'svgwrite', 'PIL._tkinter_finder'],
+    hiddenimports=['tkinterdnd2', 'fitz', 'svgwrite', 'PIL._tkinter_finder'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'numpy',
+        'scipy',
+        'matplotlib',
+        'tornado',
+        'IPython',
+        'pytest',
+        'notebook',
+        'sqlite3',
+        'lib2to3',
+        'xmlrpc',
+        'test',
+    ],
     noarchive=False,
-    optimize=0,
+    optimize=2, # -OO: strip docstrings/asserts from bundled pycs
 )
 pyz = PYZ(a.pure)
 
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='PPTX_to_Picture',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
     upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +48,12 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='PPTX_to_Picture',
+)